@@ -60,15 +60,15 @@ def load_material_id(material, mat_id, data_class):
     """
     binding = data_class.material_bind
 
-    for id, mat in binding.items():
-        if id != "version":
-            if id == mat_id:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    # the material id is the key of the binding, no need to search for it
+    if mat_id != "version" and mat_id in binding:
+        mat = binding[mat_id]
+
+        material.material_id = mat_id
+        material.name = mat["name"]
+        material.density = mat["density"]
+        material.thermal_conduc = mat["thermal_conduc"]
+        material.heat_capac = mat["heat_capac"]
+        material.solar_absorp = mat["solar_absorp"]
+        material.thickness_default = mat["thickness_default"]
+        material.thickness_list = mat["thickness_list"]
@@ -73,8 +73,11 @@ from teaser.logic.buildingobjects.buildingphysics.ceiling import Ceiling
 from teaser.logic.buildingobjects.buildingphysics.window import Window
 from teaser.logic.buildingobjects.buildingphysics.innerwall import InnerWall
 
+# strings in the excel file that are interpreted as missing values
+_NAN_STRINGS = {"", "N/a", "n/A", "NAN", "nan", "na", "Na", "nA", "NA"}
 
-def import_data(path=None, sheet_names=None):
+
+def import_data(path=None, sheet_names=None, usecols=None, engine=None):
     """
     Import data from the building data excel file and perform some
     preprocessing for nan and empty cells.
@@ -84,31 +87,57 @@ def import_data(path=None, sheet_names=None):
     ----------
     path: str
         path to the excel file that should be imported
-    sheet_names: list or str
+    sheet_names: list, tuple or str
         sheets of excel that should be imported
+    usecols: list
+        column headers that should be imported, the first column holding the
+        index has to be included. All other columns are skipped while
+        parsing, which speeds up the import of large sheets. Default is None,
+        which imports all columns.
+    engine: str
+        engine pandas uses to read the excel file, e.g. "openpyxl" or
+        "calamine" (pandas >= 2.2). Default is None, which lets pandas choose
+        the engine by the file format, so .xls, .ods and .xlsb files can be
+        imported as well.
     """
 
     # process an import of a single sheet as well as several sheets,
     # which will be concatenated with an continuous index
-    if type(sheet_names) == list:
-        data = pd.DataFrame()
-        _data = pd.read_excel(io=path, sheet_name=sheet_names, header=0, index_col=None)
-        for sheet in sheet_names:
-            data = data.append(_data[sheet], sort=False)
+    if isinstance(sheet_names, (list, tuple)):
+        _data = pd.read_excel(
+            io=path,
+            sheet_name=list(sheet_names),
+            header=0,
+            index_col=None,
+            usecols=usecols,
+            engine=engine,
+        )
+        data = pd.concat([_data[sheet] for sheet in sheet_names], sort=False)
         data = data.reset_index(drop=False)
         data["index"] = data["index"] + 2  # sync the index with the excel index
     else:
-        data = pd.read_excel(io=path, sheet_name=sheet_names, header=0, index_col=0)
-
-    # Cut of leading or tailing white spaces from any string in the dataframe
-    data = data.applymap(lambda x: x.strip() if type(x) is str else x)
+        data = pd.read_excel(
+            io=path,
+            sheet_name=sheet_names,
+            header=0,
+            index_col=0,
+            usecols=usecols,
+            engine=engine,
+        )
 
+    # Cut of leading or tailing white spaces from any string in the dataframe,
+    # only object columns can hold strings; non string entries of mixed
+    # columns are kept as they are.
     # Convert every N/A, nan, empty strings and strings called N/a, n/A, NAN,
     # nan, na, Na, nA or NA to np.nan
-    data = data.replace(
-        ["", "N/a", "n/A", "NAN", "nan", "na", "Na", "nA", "NA"], np.nan, regex=False
-    )
-    data = data.fillna(np.nan)
+    for col in data.select_dtypes(include="object").columns:
+        column = data[col]
+        try:
+            stripped = column.str.strip().fillna(column)
+        except AttributeError:
+            # column does not contain any strings
+            stripped = column
+        data[col] = stripped.mask(stripped.isin(_NAN_STRINGS)).infer_objects()
 
     return data
 
@@ -124,17 +153,37 @@ def get_list_of_present_entries(list_):
         list that shall be processed
     """
 
-    _List = []
-    for x in list_:
-        if x not in _List:
-            if not None:
-                if not pd.isna(x):
-                    _List.append(x)
-    return _List
+    return list(pd.unique(pd.Series(list_).dropna()))
 
 
 # Block: Zoning methodologies (define your zoning function here)
 # -------------------------------------------------------------
+# columns of the excel file used by zoning_example and
+# import_building_from_excel, extend this list if your zoning function
+# needs further columns
+ZONING_EXAMPLE_COLUMNS = [
+    "Index",
+    "UsageType",
+    "RoomIdentifier",
+    "BelongsToIdentifier",
+    "NetArea[m²]",
+    "HeatedRoomHeight[m]",
+    "WindowOrientation[°]",
+    "WindowArea[m²]",
+    "WindowConstruction",
+    "OuterWallOrientation[°]",
+    "OuterWallArea[m²]",
+    "OuterWallConstruction",
+    "WallAdjacentTo",
+    "InnerWallArea[m²]",
+    "InnerWallConstruction",
+    "IsGroundFloor",
+    "IsRooftop",
+    "FloorConstruction",
+    "CeilingConstruction",
+]
+
+
 def zoning_example(data):
     """
     This is an example on how the rooms of a building could be aggregated to
@@ -163,73 +212,64 @@ def zoning_example(data):
     # !right now the wall construction of the added wall is not respected,
     # the same wall construction as regular
     # inner wall is set
-    for index, line in data.iterrows():
-        if not pd.isna(line["WallAdjacentTo"]):
-            data.loc[index, "InnerWallArea[m²]"] = (
-                data.loc[index, "OuterWallArea[m²]"]
-                + data.loc[index, "WindowArea[m²]"]
-                + data.loc[index, "InnerWallArea[m²]"]
-            )
-            data.loc[index, "WindowOrientation[°]"] = np.NaN
-            data.loc[index, "WindowArea[m²]"] = np.NaN
-            data.loc[index, "WindowConstruction"] = np.NaN
-            data.loc[index, "OuterWallOrientation[°]"] = np.NaN
-            data.loc[index, "OuterWallArea[m²]"] = np.NaN
-            data.loc[index, "OuterWallConstruction"] = np.NaN
+    adjacent = data["WallAdjacentTo"].notna()
+    data.loc[adjacent, "InnerWallArea[m²]"] = (
+        data.loc[adjacent, "OuterWallArea[m²]"]
+        + data.loc[adjacent, "WindowArea[m²]"]
+        + data.loc[adjacent, "InnerWallArea[m²]"]
+    )
+    data.loc[
+        adjacent,
+        [
+            "WindowOrientation[°]",
+            "WindowArea[m²]",
+            "WindowConstruction",
+            "OuterWallOrientation[°]",
+            "OuterWallArea[m²]",
+            "OuterWallConstruction",
+        ],
+    ] = np.NaN
 
     # make all rooms that belong to a certain room have the same room identifier
-    _list = []
-    for index, line in data.iterrows():
-        if pd.isna(line["BelongsToIdentifier"]):
-            _list.append(line["RoomIdentifier"])
-        else:
-            _list.append(line["BelongsToIdentifier"])
-    data["RoomCluster"] = _list
+    data["RoomCluster"] = data["BelongsToIdentifier"].fillna(data["RoomIdentifier"])
 
     # check for lines in which the net area is zero, marking an second wall
     # or window
     # element for the respective room, and in which there is still stated a
     # UsageType which is wrong
     # and should be changed in the file
-    for i, row in data.iterrows():
-        if (row["NetArea[m²]"] == 0 or row["NetArea[m²]"] == np.nan) and not pd.isna(
-            row["UsageType"]
-        ):
-            warnings.warn(
-                "In line %s the net area is zero, marking an second wall or "
-                "window element for the respective room, "
-                "and in which there is still stated a UsageType which is "
-                "wrong and should be changed in the file" % i
-            )
+    net_area = data["NetArea[m²]"]
+    faulty = ((net_area == 0) | net_area.isna()) & data["UsageType"].notna()
+    if faulty.any():
+        warnings.warn(
+            "In lines %s the net area is zero, marking an second wall or "
+            "window element for the respective room, "
+            "and in which there is still stated a UsageType which is "
+            "wrong and should be changed in the file" % list(data.index[faulty])
+        )
 
     # make all rooms of the cluster having the usage type of the main usage type
-    _groups = data.groupby(["RoomCluster"])
-    for index, cluster in _groups:
-        count = 0
-        for line in cluster.iterrows():
-            if pd.isna(line[1]["BelongsToIdentifier"]) and not pd.isna(
-                line[1]["UsageType"]
-            ):
-                main_usage = line[1]["UsageType"]
-                for i, row in data.iterrows():
-                    if row["RoomCluster"] == line[1]["RoomCluster"]:
-                        data.loc[i, "RoomClusterUsage"] = main_usage
-                count += 1
-        if count != 1:
-            warnings.warn(
-                "This cluster has more than one main usage type or none, "
-                "check your excel file for mistakes! \n"
-                "Common mistakes: \n"
-                "-NetArea of a wall is not equal to 0 \n"
-                "-UsageType of a wall is not empty \n"
-                "Explanation: Rooms may have outer walls/windows on different orientations.\n"
-                "Every row with an empty slot in the column UsageType, "
-                "marks another direction of an outer wall and/or"
-                "window entity of the same room.\n"
-                "The connection of the same room is realised by an "
-                "RoomIdentifier equal to the respective "
-                "BelongsToIdentifier. \n Cluster = %s" % cluster
-            )
+    is_main = data["BelongsToIdentifier"].isna() & data["UsageType"].notna()
+    data["RoomClusterUsage"] = (
+        data["UsageType"].where(is_main).groupby(data["RoomCluster"]).transform("last")
+    )
+    count = is_main.groupby(data["RoomCluster"]).sum()
+    for name in count.index[count != 1]:
+        cluster = data[data["RoomCluster"] == name]
+        warnings.warn(
+            "This cluster has more than one main usage type or none, "
+            "check your excel file for mistakes! \n"
+            "Common mistakes: \n"
+            "-NetArea of a wall is not equal to 0 \n"
+            "-UsageType of a wall is not empty \n"
+            "Explanation: Rooms may have outer walls/windows on different orientations.\n"
+            "Every row with an empty slot in the column UsageType, "
+            "marks another direction of an outer wall and/or"
+            "window entity of the same room.\n"
+            "The connection of the same room is realised by an "
+            "RoomIdentifier equal to the respective "
+            "BelongsToIdentifier. \n Cluster = %s" % cluster
+        )
 
     # name usage types after usage types available in the json
     usage_to_json_usage = {
@@ -250,24 +290,39 @@ def zoning_example(data):
 
     # rename all zone names from the excel to the according zone name which
     # is in the UseConditions.json files
-    usages = get_list_of_present_entries(data["RoomClusterUsage"])
-    data["UsageType_Teaser"] = ""
-    for usage in usages:
-        data["UsageType_Teaser"] = np.where(
-            data["RoomClusterUsage"] == usage,
-            usage_to_json_usage[usage],
-            data["UsageType_Teaser"],
+    # the usage columns hold only a few distinct values, as categoricals they
+    # are stored as integer codes and mapped once per usage instead of per row
+    data["RoomClusterUsage"] = data["RoomClusterUsage"].astype("category")
+    data["UsageType_Teaser"] = data["RoomClusterUsage"].map(usage_to_json_usage)
+    unknown_usages = get_list_of_present_entries(
+        data.loc[data["UsageType_Teaser"].isna(), "RoomClusterUsage"]
+    )
+    if unknown_usages:
+        raise ValueError(
+            "The usage types %s could not be found in usage_to_json_usage."
+            % unknown_usages
         )
+    data["UsageType_Teaser"] = (
+        data["UsageType_Teaser"].astype(object).fillna("").astype("category")
+    )
 
     # name the column where the zones are defined "Zone"
-    data["Zone"] = data["UsageType_Teaser"]
+    # Zone stays a plain object column, grouping by it sorts the zones by
+    # name, which defines the order of the thermal zones in the building
+    data["Zone"] = data["UsageType_Teaser"].astype(object)
 
     return data
 
 
 # -------------------------------------------------------------
 def import_building_from_excel(
-    project, building_name, construction_age, path_to_excel, sheet_names
+    project,
+    building_name,
+    construction_age,
+    path_to_excel,
+    sheet_names,
+    usecols=None,
+    engine=None,
 ):
     """
     Import building data from excel, convert it via the respective zoning and feed it to teasers logic classes.
@@ -283,16 +338,23 @@ def import_building_from_excel(
         construction age of the building
     path_to_excel: str
         path to excel file to be imported
-    sheet_names: str or list
+    sheet_names: str, list or tuple
         sheet names which shall be imported
+    usecols: list
+        column headers which shall be imported, e.g. ZONING_EXAMPLE_COLUMNS.
+        Default is None, which imports all columns.
+    engine: str
+        engine pandas uses to read the excel file, e.g. "calamine" (pandas >=
+        2.2) for a faster import. Default is None, which lets pandas choose
+        the engine by the file format.
     return data: pandas.DataFrame
         zoned DataFrame which is finally used to parametrize the teaser classes
     return project: Project()
         TEASER instance of Project filled with the imported building data
     """
 
-    def warn_constructiontype(element):
-        """Generic warning function"""
+    def warn_constructiontype(element, zone_name, construction, rows):
+        """Generic warning function, rows are the positions of the entries"""
         if element.construction_type is None:
             warnings.warn(
                 'In zone "%s" the %s construction "%s" could not be loaded from the TypeBuildingElements.json, '
@@ -301,13 +363,21 @@ def import_building_from_excel(
                 "Here is the list of faulty entries:\n%s"
                 "\nThese entries can easily be found checking the stated index in the produced ZonedInput.xlsx"
                 % (
-                    group["Zone"].iloc[0],
+                    zone_name,
                     element.name,
-                    group["OuterWallConstruction"].iloc[0],
-                    group,
+                    construction,
+                    data.iloc[rows],
                 )
             )
 
+    def warn_no_area(zone_name, flag, value, construction, elements):
+        """Warning function for floors and ceilings without area"""
+        warnings.warn(
+            'zone "%s" with %s "%s" and construction type "%s" has no %s, '
+            "since the area equals 0."
+            % (zone_name, flag, value, construction, elements)
+        )
+
     bldg = Building(parent=project)
     bldg.name = building_name
     bldg.year_of_construction = construction_age
@@ -344,7 +414,7 @@ def import_building_from_excel(
     # -----------------------------
 
     # load_building_data from excel_to_pandas DataFrame:
-    data = import_data(path_to_excel, sheet_names)
+    data = import_data(path_to_excel, sheet_names, usecols, engine)
 
     # informative print
     usage_types = get_list_of_present_entries(data["UsageType"])
@@ -360,55 +430,107 @@ def import_building_from_excel(
     # aggregate all rooms of each zone and for each set general parameter,
     # boundary conditions
     # and parameter regarding the building physics
-    zones = data.groupby(["Zone"])
-    for name, zone in zones:
+    def group_by_zone(columns, area_column, rows=None):
+        """Group the whole data set once and sort the groups by zone
+
+        Each group is stored together with its values of the grouped columns,
+        its summed up area, which is aggregated for all groups at once, and
+        the positions of its rows in data. The rows themselves are only
+        sliced from data if a warning is raised for the group.
+        If rows is given, only the selected rows are grouped.
+        """
+        groups = {}
+        if rows is None:
+            selected = data
+            positions = np.arange(len(data))
+        else:
+            selected = data[rows]
+            positions = np.flatnonzero(rows)
+        grouped = selected.groupby(["Zone"] + columns)
+        areas = grouped[area_column].sum()
+        indices = grouped.indices
+        for key, area in zip(areas.index, areas.to_numpy()):
+            groups.setdefault(key[0], []).append(
+                (key[1:], area, positions[indices[key]])
+            )
+        return groups
+
+    # group the building elements of all zones at once instead of grouping
+    # each zone separately
+    outer_wall_groups = group_by_zone(
+        ["OuterWallOrientation[°]", "OuterWallConstruction"], "OuterWallArea[m²]"
+    )
+    window_groups = group_by_zone(
+        ["WindowOrientation[°]", "WindowConstruction"], "WindowArea[m²]"
+    )
+    # floors and ceilings are split by the flags IsGroundFloor and IsRooftop
+    # before grouping them by construction
+    for flag in ["IsGroundFloor", "IsRooftop"]:
+        if not data[flag].dropna().isin([0, 1]).all():
+            warnings.warn(
+                "Values for %s have to be either 0 or 1, "
+                "for no or yes respectively" % flag
+            )
+    ground_floor_groups = group_by_zone(
+        ["FloorConstruction"], "NetArea[m²]", data["IsGroundFloor"] == 1
+    )
+    floor_groups = group_by_zone(
+        ["FloorConstruction"], "NetArea[m²]", data["IsGroundFloor"] == 0
+    )
+    rooftop_groups = group_by_zone(
+        ["CeilingConstruction"], "NetArea[m²]", data["IsRooftop"] == 1
+    )
+    ceiling_groups = group_by_zone(
+        ["CeilingConstruction"], "NetArea[m²]", data["IsRooftop"] == 0
+    )
+    inner_wall_groups = group_by_zone(["InnerWallConstruction"], "InnerWallArea[m²]")
+
+    # aggregate the general zone parameters of all zones at once, without
+    # creating a DataFrame for each zone
+    zones = data.groupby("Zone")
+    zone_areas = zones["NetArea[m²]"].sum()
+    # room vice calculation of volume plus summing those
+    room_volumes = data["NetArea[m²]"] * data["HeatedRoomHeight[m]"]
+    zone_volumes = room_volumes.groupby(data["Zone"]).sum()
+    zone_usages = zones["UsageType_Teaser"].first()
+
+    for name in zone_areas.index:
 
         # Block: Thermal zone (general parameter)
         tz = ThermalZone(parent=bldg)
         tz.name = str(name)
-        tz.area = np.nansum(zone["NetArea[m²]"])
-        # room vice calculation of volume plus summing those
-        tz.volume = np.nansum(
-            np.array(zone["NetArea[m²]"]) * np.array(zone["HeatedRoomHeight[m]"])
-        )
+        tz.area = zone_areas[name]
+        tz.volume = zone_volumes[name]
 
         # Block: Boundary Conditions
         # load UsageOperationTime, Lighting, RoomClimate and InternalGains
         # from the "UseCondition.json"
         tz.use_conditions = UseConditions(parent=tz)
-        tz.use_conditions.load_use_conditions(
-            zone["UsageType_Teaser"].iloc[0], project.data
-        )
+        tz.use_conditions.load_use_conditions(zone_usages[name], project.data)
 
         # Block: Building Physics
         # Grouping by orientation and construction type
         # aggregating and feeding to the teaser logic classes
-        grouped = zone.groupby(["OuterWallOrientation[°]", "OuterWallConstruction"])
-        for name, group in grouped:
+        for (orientation, construction), area, rows in outer_wall_groups.get(name, []):
             # looping through a groupby object automatically discards the
             # groups where one of the attributes is nan
             # additionally check for strings, since the value must be of type
             # int or float
-            if not isinstance(group["OuterWallOrientation[°]"].iloc[0], str):
-                if (
-                    np.nansum(group["OuterWallArea[m²]"]) > 0
-                ):  # only create element if it has an area
+            if not isinstance(orientation, str):
+                if area > 0:  # only create element if it has an area
                     out_wall = OuterWall(parent=tz)
                     out_wall.name = (
-                        "outer_wall_"
-                        + str(int(group["OuterWallOrientation[°]"].iloc[0]))
-                        + "_"
-                        + str(group["OuterWallConstruction"].iloc[0])
+                        "outer_wall_" + str(int(orientation)) + "_" + str(construction)
                     )
-                    out_wall.area = np.nansum(group["OuterWallArea[m²]"])
+                    out_wall.area = area
                     out_wall.tilt = out_wall_tilt
-                    out_wall.orientation = group["OuterWallOrientation[°]"].iloc[0]
+                    out_wall.orientation = orientation
                     # load wall properties from "TypeBuildingElements.json"
                     out_wall.load_type_element(
                         year=bldg.year_of_construction,
-                        construction=group["OuterWallConstruction"].iloc[0],
+                        construction=construction,
                     )
-                    warn_constructiontype(out_wall)
+                    warn_constructiontype(out_wall, name, construction, rows)
             else:
                 warnings.warn(
                     'In zone "%s" the OuterWallOrientation "%s" is '
@@ -418,38 +540,32 @@ def import_building_from_excel(
                     "\n These entries can easily be found checking the stated "
                     "index in the produced ZonedInput.xlsx"
                     % (
-                        group["Zone"].iloc[0],
-                        group["OuterWallOrientation[°]"].iloc[0],
-                        group,
+                        name,
+                        orientation,
+                        data.iloc[rows],
                     )
                 )
 
-        grouped = zone.groupby(["WindowOrientation[°]", "WindowConstruction"])
-        for name, group in grouped:
+        for (orientation, construction), area, rows in window_groups.get(name, []):
             # looping through a groupby object automatically discards the
             # groups where one of the attributes is nan
             # additionally check for strings, since the value must be of type
             # int or float
-            if not isinstance(group["WindowOrientation[°]"].iloc[0], str):
-                if (
-                    np.nansum(group["WindowArea[m²]"]) > 0
-                ):  # only create element if it has an area
+            if not isinstance(orientation, str):
+                if area > 0:  # only create element if it has an area
                     window = Window(parent=tz)
                     window.name = (
-                        "window_"
-                        + str(int(group["WindowOrientation[°]"].iloc[0]))
-                        + "_"
-                        + str(group["WindowConstruction"].iloc[0])
+                        "window_" + str(int(orientation)) + "_" + str(construction)
                     )
-                    window.area = np.nansum(group["WindowArea[m²]"])
+                    window.area = area
                     window.tilt = window_tilt
-                    window.orientation = group["WindowOrientation[°]"].iloc[0]
+                    window.orientation = orientation
                     # load wall properties from "TypeBuildingElements.json"
                     window.load_type_element(
                         year=bldg.year_of_construction,
-                        construction=group["WindowConstruction"].iloc[0],
+                        construction=construction,
                     )
-                    warn_constructiontype(window)
+                    warn_constructiontype(window, name, construction, rows)
             else:
                 warnings.warn(
                     'In zone "%s" the window orientation "%s" is neither '
@@ -459,129 +575,101 @@ def import_building_from_excel(
                     "\nThese entries can easily be found checking the stated "
                     "index in the produced ZonedInput.xlsx"
                     % (
-                        group["Zone"].iloc[0],
-                        group["WindowOrientation[°]"].iloc[0],
-                        group,
+                        name,
+                        orientation,
+                        data.iloc[rows],
                     )
                 )
 
-        grouped = zone.groupby(["IsGroundFloor", "FloorConstruction"])
-        for name, group in grouped:
-            if np.nansum(group["NetArea[m²]"]) != 0:  # to avoid devision by 0
-                if group["IsGroundFloor"].iloc[0] == 1:
-                    ground_floor = GroundFloor(parent=tz)
-                    ground_floor.name = "ground_floor" + str(
-                        group["FloorConstruction"].iloc[0]
-                    )
-                    ground_floor.area = np.nansum(group["NetArea[m²]"])
-                    ground_floor.tilt = ground_floor_tilt
-                    ground_floor.orientation = ground_floor_orientation
-                    # load wall properties from "TypeBuildingElements.json"
-                    ground_floor.load_type_element(
-                        year=bldg.year_of_construction,
-                        construction=group["FloorConstruction"].iloc[0],
-                    )
-                    warn_constructiontype(ground_floor)
-                elif group["IsGroundFloor"].iloc[0] == 0:
-                    floor = Floor(parent=tz)
-                    floor.name = "floor" + str(group["FloorConstruction"].iloc[0])
-                    floor.area = np.nansum(group["NetArea[m²]"]) / 2  # only half of
-                    # the floor belongs to this story
-                    floor.tilt = floor_tilt
-                    floor.orientation = floor_orientation
-                    # load wall properties from "TypeBuildingElements.json"
-                    floor.load_type_element(
-                        year=bldg.year_of_construction,
-                        construction=group["FloorConstruction"].iloc[0],
-                    )
-                    warn_constructiontype(floor)
-                else:
-                    warnings.warn(
-                        "Values for IsGroundFloor have to be either 0 or 1, "
-                        "for no or yes respectively"
-                    )
+        for (construction,), area, rows in ground_floor_groups.get(name, []):
+            if area != 0:  # to avoid devision by 0
+                ground_floor = GroundFloor(parent=tz)
+                ground_floor.name = "ground_floor" + str(construction)
+                ground_floor.area = area
+                ground_floor.tilt = ground_floor_tilt
+                ground_floor.orientation = ground_floor_orientation
+                # load wall properties from "TypeBuildingElements.json"
+                ground_floor.load_type_element(
+                    year=bldg.year_of_construction,
+                    construction=construction,
+                )
+                warn_constructiontype(ground_floor, name, construction, rows)
             else:
-                warnings.warn(
-                    'zone "%s" with IsGroundFloor "%s" and construction '
-                    'type "%s" '
-                    "has no floor nor groundfloor, since the area equals 0."
-                    % (
-                        group["Zone"].iloc[0],
-                        group["IsGroundFloor"].iloc[0],
-                        group["FloorConstruction"].iloc[0],
-                    )
+                warn_no_area(
+                    name, "IsGroundFloor", 1, construction, "floor nor groundfloor"
                 )
 
-        grouped = zone.groupby(["IsRooftop", "CeilingConstruction"])
-        for name, group in grouped:
-            if np.nansum(group["NetArea[m²]"]) != 0:  # to avoid devision by 0
-                if group["IsRooftop"].iloc[0] == 1:
-                    rooftop = Rooftop(parent=tz)
-                    rooftop.name = "rooftop" + str(group["CeilingConstruction"].iloc[0])
-                    rooftop.area = np.nansum(
-                        group["NetArea[m²]"]
-                    )  # sum up area of respective
-                    # rooftop parts
-                    rooftop.tilt = rooftop_tilt
-                    rooftop.orientation = rooftop_orientation
-                    # load wall properties from "TypeBuildingElements.json"
-                    rooftop.load_type_element(
-                        year=bldg.year_of_construction,
-                        construction=group["CeilingConstruction"].iloc[0],
-                    )
-                    warn_constructiontype(rooftop)
-                elif group["IsRooftop"].iloc[0] == 0:
-                    ceiling = Ceiling(parent=tz)
-                    ceiling.name = "ceiling" + str(group["CeilingConstruction"].iloc[0])
-                    ceiling.area = np.nansum(group["NetArea[m²]"]) / 2  # only half
-                    # of the ceiling belongs to a story,
-                    # the other half to the above
-                    ceiling.tilt = ceiling_tilt
-                    ceiling.orientation = ceiling_orientation
-                    # load wall properties from "TypeBuildingElements.json"
-                    ceiling.load_type_element(
-                        year=bldg.year_of_construction,
-                        construction=group["CeilingConstruction"].iloc[0],
-                    )
-                    warn_constructiontype(ceiling)
-                else:
-                    warnings.warn(
-                        "Values for IsRooftop have to be either 0 or 1, "
-                        "for no or yes respectively"
-                    )
+        for (construction,), area, rows in floor_groups.get(name, []):
+            if area != 0:  # to avoid devision by 0
+                floor = Floor(parent=tz)
+                floor.name = "floor" + str(construction)
+                floor.area = area / 2  # only half of
+                # the floor belongs to this story
+                floor.tilt = floor_tilt
+                floor.orientation = floor_orientation
+                # load wall properties from "TypeBuildingElements.json"
+                floor.load_type_element(
+                    year=bldg.year_of_construction,
+                    construction=construction,
+                )
+                warn_constructiontype(floor, name, construction, rows)
             else:
-                warnings.warn(
-                    'zone "%s" with IsRooftop "%s" and construction type '
-                    '"%s" '
-                    "has no ceiling nor rooftop, since the area equals 0."
-                    % (
-                        group["Zone"].iloc[0],
-                        group["IsRooftop"].iloc[0],
-                        group["CeilingConstruction"].iloc[0],
-                    )
+                warn_no_area(
+                    name, "IsGroundFloor", 0, construction, "floor nor groundfloor"
                 )
 
-        grouped = zone.groupby(["InnerWallConstruction"])
-        for name, group in grouped:
-            if np.nansum(group["InnerWallArea[m²]"]) != 0:  # to avoid devision by 0
-                in_wall = InnerWall(parent=tz)
-                in_wall.name = "inner_wall" + str(
-                    group["InnerWallConstruction"].iloc[0]
+        for (construction,), area, rows in rooftop_groups.get(name, []):
+            if area != 0:  # to avoid devision by 0
+                rooftop = Rooftop(parent=tz)
+                rooftop.name = "rooftop" + str(construction)
+                rooftop.area = area  # sum up area of respective
+                # rooftop parts
+                rooftop.tilt = rooftop_tilt
+                rooftop.orientation = rooftop_orientation
+                # load wall properties from "TypeBuildingElements.json"
+                rooftop.load_type_element(
+                    year=bldg.year_of_construction,
+                    construction=construction,
+                )
+                warn_constructiontype(rooftop, name, construction, rows)
+            else:
+                warn_no_area(name, "IsRooftop", 1, construction, "ceiling nor rooftop")
+
+        for (construction,), area, rows in ceiling_groups.get(name, []):
+            if area != 0:  # to avoid devision by 0
+                ceiling = Ceiling(parent=tz)
+                ceiling.name = "ceiling" + str(construction)
+                ceiling.area = area / 2  # only half
+                # of the ceiling belongs to a story,
+                # the other half to the above
+                ceiling.tilt = ceiling_tilt
+                ceiling.orientation = ceiling_orientation
+                # load wall properties from "TypeBuildingElements.json"
+                ceiling.load_type_element(
+                    year=bldg.year_of_construction,
+                    construction=construction,
                 )
-                in_wall.area = np.nansum(group["InnerWallArea[m²]"]) / 2  # only
+                warn_constructiontype(ceiling, name, construction, rows)
+            else:
+                warn_no_area(name, "IsRooftop", 0, construction, "ceiling nor rooftop")
+
+        for (construction,), area, rows in inner_wall_groups.get(name, []):
+            if area != 0:  # to avoid devision by 0
+                in_wall = InnerWall(parent=tz)
+                in_wall.name = "inner_wall" + str(construction)
+                in_wall.area = area / 2  # only
                 # half of the wall belongs to each room,
                 # the other half to the adjacent
                 # load wall properties from "TypeBuildingElements.json"
                 in_wall.load_type_element(
                     year=bldg.year_of_construction,
-                    construction=group["InnerWallConstruction"].iloc[0],
+                    construction=construction,
                 )
-                warn_constructiontype(in_wall)
+                warn_constructiontype(in_wall, name, construction, rows)
             else:
                 warnings.warn(
                     'zone "%s" with inner wall construction "%s" has no '
-                    "inner walls, since area = 0."
-                    % (group["Zone"].iloc[0], group["InnerWallConstructio" "n"].iloc[0])
+                    "inner walls, since area = 0." % (name, construction)
                 )
 
         # Block: AHU and infiltration #Attention hard coding
@@ -631,7 +719,12 @@ if __name__ == "__main__":
         os.path.dirname(__file__), "examplefiles", "ExcelBuildingData_Sample.xlsx"
     )
     prj, Data = import_building_from_excel(
-        prj, "ExampleImport", 2000, PathToExcel, sheet_names=["ImportSheet1"]
+        prj,
+        "ExampleImport",
+        2000,
+        PathToExcel,
+        sheet_names=["ImportSheet1"],
+        usecols=ZONING_EXAMPLE_COLUMNS,
     )
 
     prj.modelica_info.current_solver = "dassl"
@@ -643,8 +736,17 @@ if __name__ == "__main__":
     prj.export_aixlib(internal_id=None, path=result_path)
 
     # if wished, export the zoned DataFrame which is finally used to
-    # parametrize the teaser classes
-    Data.to_excel(os.path.join(result_path, prj.name, "ZonedInput.xlsx"))
+    # parametrize the teaser classes. xlsxwriter writes the file considerably
+    # faster than the default openpyxl writer, hence it is used if installed
+    try:
+        import xlsxwriter  # noqa: F401
+
+        excel_engine = "xlsxwriter"
+    except ImportError:
+        excel_engine = None
+    Data.to_excel(
+        os.path.join(result_path, prj.name, "ZonedInput.xlsx"), engine=excel_engine
+    )
     # if wished, save the current python script to the results folder to
     # track the used parameters and reproduce results
     shutil.copy(__file__, os.path.join(result_path, prj.name))
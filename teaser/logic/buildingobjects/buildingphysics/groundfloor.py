@@ -1,10 +1,92 @@
 # created June 2015
 # by TEASER4 Development Team
-import warnings
+import types
+
+import numpy as np
 
 from teaser.logic.buildingobjects.buildingphysics.outerwall \
     import OuterWall
 
+# Default attributes of every GroundFloor, applied in one dict update
+_GF_DEFAULTS = types.MappingProxyType({
+    "_tilt": 0.0,
+    "_orientation": -2.0,
+    "_inner_convection": 1.7,
+    "_inner_radiation": 5.0,
+    "_outer_convection": None,
+    "_outer_radiation": None})
+
+# Required U-values for ground floors in retrofit cases according to WSVO and
+# EnEv, each value applies from the corresponding year of retrofit on
+_RETROFIT_YEARS = (1977, 1982, 1995, 2002, 2009, 2014)
+_RETROFIT_U_VALUES = (0.8, 0.7, 0.5, 0.4, 0.3, 0.3)
+# inverse table, first year from which a U-value is required
+_RETROFIT_YEAR_BY_U_VALUE = types.MappingProxyType(dict(
+    zip(reversed(_RETROFIT_U_VALUES), reversed(_RETROFIT_YEARS))))
+
+
+def u_for_year(year_of_retrofit):
+    """Required U-value of a ground floor for a year of retrofit
+
+    The lookup is vectorized, so sweeps over many years of retrofit can be
+    done in one call, e.g. u_for_year(np.arange(1977, 2051)).
+
+    Parameters
+    ----------
+    year_of_retrofit : int or array_like
+        Year(s) of the retrofit of the ground floor
+
+    Returns
+    -------
+    calc_u : float or numpy.ndarray
+        Required U-value(s) according to WSVO and EnEv [W/(m2*K)], an array
+        if year_of_retrofit is array_like
+
+    Raises
+    ------
+    ValueError
+        If a year_of_retrofit is not finite (e.g. nan) or before 1977, since
+        no U-value is required by WSVO or EnEv then
+
+    """
+    years = np.asarray(year_of_retrofit)
+    indices = np.searchsorted(_RETROFIT_YEARS, years, side="right") - 1
+    # searchsorted sorts nan after the last year, so check for it explicitly
+    invalid = (indices < 0) | ~np.isfinite(years)
+    if np.any(invalid):
+        raise ValueError(
+            "year_of_retrofit=%s must be a finite year %s or later, no "
+            "U-value is required by WSVO/EnEv before" % (
+                years[invalid].tolist(), _RETROFIT_YEARS[0]))
+    u_values = np.asarray(_RETROFIT_U_VALUES)[indices]
+    if u_values.ndim == 0:
+        return float(u_values)
+    return u_values
+
+
+def earliest_year_for_u(calc_u):
+    """First year of retrofit from which a U-value is required
+
+    Parameters
+    ----------
+    calc_u : float
+        Required U-value of a ground floor [W/(m2*K)], has to be one of the
+        U-values required by WSVO and EnEv
+
+    Returns
+    -------
+    year_of_retrofit : int
+        First year of retrofit for which u_for_year returns calc_u
+
+    """
+    try:
+        return _RETROFIT_YEAR_BY_U_VALUE[calc_u]
+    except KeyError:
+        raise ValueError(
+            "%s is none of the required U-values %s"
+            % (calc_u, sorted(_RETROFIT_YEAR_BY_U_VALUE, reverse=True))
+        ) from None
+
 
 class GroundFloor(OuterWall):
     """GroundFloor class
@@ -110,12 +192,7 @@ class GroundFloor(OuterWall):
         """
         super(GroundFloor, self).__init__(parent)
 
-        self._tilt = 0.0
-        self._orientation = -2.0
-        self._inner_convection = 1.7
-        self._inner_radiation = 5.0
-        self._outer_convection = None
-        self._outer_radiation = None
+        self.__dict__.update(_GF_DEFAULTS)
 
     def retrofit_wall(self, year_of_retrofit, material=None):
         """Retrofits wall to German refurbishment standards.
@@ -141,19 +218,52 @@ class GroundFloor(OuterWall):
         material, year_of_retrofit = self.initialize_retrofit(
             material, year_of_retrofit)
 
-        calc_u = None
-
-        if 1977 <= year_of_retrofit <= 1981:
-            calc_u = 0.8
-        elif 1982 <= year_of_retrofit <= 1994:
-            calc_u = 0.7
-        elif 1995 <= year_of_retrofit <= 2001:
-            calc_u = 0.5
-        elif 2002 <= year_of_retrofit <= 2008:
-            calc_u = 0.4
-        elif 2009 <= year_of_retrofit <= 2013:
-            calc_u = 0.3
-        elif year_of_retrofit >= 2014:
-            calc_u = 0.3
+        calc_u = u_for_year(year_of_retrofit)
 
         self.set_insulation(material, calc_u, year_of_retrofit)
+
+    @classmethod
+    def retrofit_walls_bulk(
+            cls,
+            ground_floors,
+            years_of_retrofit,
+            material=None):
+        """Retrofits several ground floors to German refurbishment standards.
+
+        Same as retrofit_wall, but the required U-values of all ground floors
+        are looked up at once. This is meant for retrofitting a large number
+        of ground floors, e.g. of a whole building stock.
+
+        Parameters
+        ----------
+        ground_floors : list
+            List of GroundFloor instances that are retrofitted
+        years_of_retrofit : list
+            Year of the retrofit for each ground floor
+        material : string or list
+            Type of material, that is used for insulation. Either one
+            material for all ground floors or a list with one material for
+            each ground floor
+
+        """
+        if material is None or isinstance(material, str):
+            material = [material] * len(ground_floors)
+
+        if not len(ground_floors) == len(years_of_retrofit) == len(material):
+            raise ValueError(
+                "ground_floors, years_of_retrofit and material must have the "
+                "same length")
+
+        materials = []
+        years = []
+        for ground_floor, mat, year in zip(
+                ground_floors, material, years_of_retrofit):
+            mat, year = ground_floor.initialize_retrofit(mat, year)
+            materials.append(mat)
+            years.append(year)
+
+        u_values = u_for_year(years)
+
+        for ground_floor, mat, year, calc_u in zip(
+                ground_floors, materials, years, u_values):
+            ground_floor.set_insulation(mat, calc_u, year)
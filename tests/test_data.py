@@ -8,6 +8,7 @@ from teaser.logic import utilities
 from teaser.project import Project
 import math
 import os
+import pytest
 import helptest
 import warnings as warnings
 
@@ -2319,6 +2320,75 @@ class Test_teaser(object):
         therm_zone.outer_walls[0].retrofit_wall(1980, "EPS_040_15")
         assert round(therm_zone.outer_walls[0].ua_value, 2) == 4.13
 
+    def test_retrofit_ground_floor(self):
+        """test of retrofit_wall for ground floors"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        therm_zone.ground_floors[0].retrofit_wall(2016, "EPS_040_15")
+        therm_zone.ground_floors[0].calc_ua_value()
+        assert round(therm_zone.ground_floors[0].ua_value, 6) == 42.0
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        therm_zone.ground_floors[0].retrofit_wall(2005, "EPS_040_15")
+        therm_zone.ground_floors[0].calc_ua_value()
+        assert round(therm_zone.ground_floors[0].ua_value, 6) == 56.0
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        therm_zone.ground_floors[0].retrofit_wall(1990, "EPS_040_15")
+        therm_zone.ground_floors[0].calc_ua_value()
+        assert round(therm_zone.ground_floors[0].ua_value, 6) == 58.351477
+
+    def test_retrofit_ground_floors_bulk(self):
+        """test of retrofit_walls_bulk for ground floors"""
+        from teaser.logic.buildingobjects.buildingphysics.groundfloor import (
+            GroundFloor,
+        )
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        helptest.building_test2(prj)
+        helptest.building_test2(prj)
+        ground_floors = [
+            bldg.thermal_zones[-1].ground_floors[0] for bldg in prj.buildings
+        ]
+        GroundFloor.retrofit_walls_bulk(
+            ground_floors, [2016, 2005, 1970], "EPS_040_15"
+        )
+        ua_values = []
+        for ground_floor in ground_floors:
+            ground_floor.calc_ua_value()
+            ua_values.append(round(ground_floor.ua_value, 6))
+        assert ua_values == [42.0, 56.0, 58.351477]
+
+    def test_ground_floor_retrofit_table(self):
+        """test of the ground floor retrofit U-value lookups"""
+        from teaser.logic.buildingobjects.buildingphysics import groundfloor
+
+        with pytest.raises(ValueError):
+            groundfloor.u_for_year(1976)
+        assert groundfloor.u_for_year(1977) == 0.8
+        assert groundfloor.u_for_year(1994) == 0.7
+        assert groundfloor.u_for_year(2001) == 0.5
+        assert groundfloor.u_for_year(2008) == 0.4
+        assert groundfloor.u_for_year(2013) == 0.3
+        assert groundfloor.u_for_year(2050) == 0.3
+        assert list(groundfloor.u_for_year([1980, 1990, 2020])) == [0.8, 0.7, 0.3]
+        with pytest.raises(ValueError):
+            groundfloor.u_for_year([1990, 1950])
+        with pytest.raises(ValueError):
+            groundfloor.u_for_year(float("nan"))
+        with pytest.raises(ValueError):
+            groundfloor.u_for_year([2000, float("nan")])
+        assert groundfloor.earliest_year_for_u(0.8) == 1977
+        assert groundfloor.earliest_year_for_u(0.3) == 2009
+        for calc_u in [0.7, 0.5, 0.4, 0.3]:
+            year = groundfloor.earliest_year_for_u(calc_u)
+            assert groundfloor.u_for_year(year) == calc_u
+            assert groundfloor.u_for_year(year - 1) != calc_u
+
     def test_calc_equivalent_res_win(self):
         """test of calc_equivalent_res, win"""
         prj.set_default()
@@ -63,3 +63,126 @@ class Test_examples(object):
         from teaser.examples import e8_change_boundary_conditions as e8
 
         prj = e8.example_change_boundary_conditions()
+
+    def test_e9_building_data_import_from_excel(self):
+        """Tests the executability of example 9"""
+        import os
+        from teaser.examples import e9_building_data_import_from_excel as e9
+
+        path = os.path.join(
+            os.path.dirname(e9.__file__),
+            "examplefiles",
+            "ExcelBuildingData_Sample.xlsx",
+        )
+        # zone name, area, volume and (name, area) of the building elements,
+        # thermal zones are sorted by name
+        zones = [
+            (
+                "Bedroom",
+                423.1,
+                1184.68,
+                [
+                    ("outer_wall_0_heavy", 6.9327),
+                    ("outer_wall_42_heavy", 40.4587),
+                    ("outer_wall_132_heavy", 27.0908),
+                    ("outer_wall_180_heavy", 34.4417),
+                    ("outer_wall_222_heavy", 18.8654),
+                    ("window_42_EnEv", 15.9006),
+                    ("window_180_EnEv", 17.1346),
+                    ("window_222_EnEv", 7.6915),
+                    ("floorheavy", 211.55),
+                    ("ceilingheavy", 211.55),
+                    ("inner_wallheavy", 621.388),
+                ],
+            ),
+            (
+                "Corridorsinthegeneralcarearea",
+                184.2,
+                515.76,
+                [
+                    ("outer_wall_42_heavy", 6.3305),
+                    ("outer_wall_132_heavy", 3.8042),
+                    ("window_42_EnEv", 1.6198),
+                    ("window_132_EnEv", 2.8532),
+                    ("floorheavy", 92.1),
+                    ("ceilingheavy", 92.1),
+                    ("inner_wallheavy", 229.3695),
+                ],
+            ),
+            (
+                "Examinationortreatmentroom",
+                36.0,
+                100.8,
+                [
+                    ("outer_wall_42_heavy", 3.2176),
+                    ("window_42_EnEv", 1.3796),
+                    ("floorheavy", 18.0),
+                    ("ceilingheavy", 18.0),
+                    ("inner_wallheavy", 40.6159),
+                ],
+            ),
+            (
+                "MeetingConferenceseminar",
+                89.6,
+                250.88,
+                [
+                    ("outer_wall_180_heavy", 9.2494),
+                    ("window_180_EnEv", 4.0291),
+                    ("floorheavy", 44.8),
+                    ("ceilingheavy", 44.8),
+                    ("inner_wallheavy", 116.0836),
+                ],
+            ),
+            (
+                "Stocktechnicalequipmentarchives",
+                51.8,
+                145.04,
+                [
+                    ("outer_wall_0_heavy", 9.9183),
+                    ("window_0_EnEv", 4.0674),
+                    ("floorheavy", 25.9),
+                    ("ceilingheavy", 25.9),
+                    ("inner_wallheavy", 82.5269),
+                ],
+            ),
+            (
+                "WCandsanitaryroomsinnonresidentialbuildings",
+                26.3,
+                73.64,
+                [
+                    ("outer_wall_1_heavy", 1.0),
+                    ("window_0_EnEv", 1.0),
+                    ("floorheavy", 13.15),
+                    ("ceilingheavy", 13.15),
+                    ("inner_wallheavy", 58.5691),
+                ],
+            ),
+        ]
+
+        for usecols in [None, e9.ZONING_EXAMPLE_COLUMNS]:
+            prj = Project(load_data=True)
+            prj, data = e9.import_building_from_excel(
+                prj,
+                "ExampleImport",
+                2000,
+                path,
+                sheet_names=["ImportSheet1"],
+                usecols=usecols,
+            )
+            thermal_zones = prj.buildings[0].thermal_zones
+            assert [tz.name for tz in thermal_zones] == [zone[0] for zone in zones]
+            for tz, (name, area, volume, elements) in zip(thermal_zones, zones):
+                assert round(tz.area, 4) == area
+                assert round(tz.volume, 4) == volume
+                tz_elements = (
+                    tz.outer_walls
+                    + tz.windows
+                    + tz.ground_floors
+                    + tz.floors
+                    + tz.rooftops
+                    + tz.ceilings
+                    + tz.inner_walls
+                )
+                assert [
+                    (element.name, round(element.area, 4)) for element in tz_elements
+                ] == elements